@@ -1,13 +1,101 @@
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Annotated, ClassVar, Generic, TypeVar
+from functools import cache
+from time import time
+from types import UnionType
+from typing import Annotated, Any, Callable, Generic, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, ValidationInfo, field_validator
+from pydantic_core import to_json
 
 from ocpi_pydantic.v221.enum import OcpiStatusCodeEnum
 
 
 
+# An http(s) URL kept as a plain `str`: checked by the pydantic-core regex engine instead of being parsed into a `HttpUrl` object.
+# The JSON schema still says `format: uri`, as it did for `HttpUrl`.
+OcpiUrl = Annotated[str, StringConstraints(min_length=1, max_length=2048, pattern=r'^https?://\S+$'), Field(json_schema_extra={'format': 'uri'})]
+
+# Short OCPI string fields, so every model spells the same length limits the same way.
+CountryCode = Annotated[str, StringConstraints(min_length=2, max_length=2)]
+PartyId = Annotated[str, StringConstraints(min_length=3, max_length=3)]
+Id36 = Annotated[str, StringConstraints(max_length=36)]
+Currency = Annotated[str, StringConstraints(max_length=3)]
+
+
+
+_UTC = timezone.utc
+_now_cache: tuple[float, datetime] = (0.0, datetime.fromtimestamp(0, _UTC))
+
+
+
+def cached_now() -> datetime:
+    '''
+    Current UTC time truncated to the second, as used for `OcpiBaseResponse.timestamp`.
+
+    The `datetime` is memoized per wall-clock second, so responses built within the same second share one instance.
+    '''
+    global _now_cache
+    second = time() // 1
+    if _now_cache[0] != second: _now_cache = (second, datetime.fromtimestamp(second, _UTC))
+    return _now_cache[1]
+
+
+
+OcpiModelGenericType = TypeVar('OcpiModelGenericType', bound=BaseModel)
+
+
+
+def construct_trusted(model: type[OcpiModelGenericType], data: dict) -> OcpiModelGenericType:
+    '''
+    Build `model` from `data` with `model_construct`, recursing into nested models and lists of models.
+
+    `model_construct` is shallow, so nested dicts would otherwise be kept as plain dicts. No validation or coercion is done at all:
+    enums, datetimes and URLs must already have their final types. Only use this for data that came out of our own storage, never
+    for payloads received from another party.
+    '''
+    values = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        values[name] = value if field is None else _construct_trusted_value(field.annotation, value)
+    return model.model_construct(**values)
+
+
+
+def _construct_trusted_value(annotation: Any, value: Any) -> Any:
+    if value is None or isinstance(value, BaseModel): return value
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        for arg in get_args(annotation):
+            if isinstance(arg, type) and issubclass(arg, BaseModel) or get_origin(arg) is list:
+                return _construct_trusted_value(arg, value)
+        return value
+    if origin is list and isinstance(value, list):
+        item_annotation = get_args(annotation)[0]
+        return [_construct_trusted_value(item_annotation, item) for item in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return construct_trusted(annotation, value)
+    return value
+
+
+
+def schema_examples(*examples: dict) -> Callable[[dict], None]:
+    '''
+    A `json_schema_extra` callable that sets `examples` on the JSON schema.
+
+    The examples themselves are built by the caller, usually at import; only copying them into the schema waits until
+    `model_json_schema()`.
+    '''
+    def json_schema_extra(schema: dict) -> None:
+        schema['examples'] = list(examples)
+    return json_schema_extra
+
+
+
+_DISPLAY_TEXT_EXAMPLES = [{"language": "en", "text": "Standard Tariff"}]
+
+
+
 class OcpiDisplayText(BaseModel):
     '''
     OCPI 16.3. DisplayText class
@@ -15,8 +103,7 @@ class OcpiDisplayText(BaseModel):
     language: str = Field(description='Language Code ISO 639-1.', min_length=2, max_length=2)
     text: str = Field(description='Text to be displayed to a end user.', max_length=512)
 
-    _example: ClassVar[dict] = {"language": "en", "text": "Standard Tariff"}
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_DISPLAY_TEXT_EXAMPLES))
 
 
 
@@ -46,19 +133,16 @@ OcpiResponseDataGenericType = TypeVar('OcpiResponseDataGenericType')
 
 
 
-class OcpiBaseResponse(BaseModel, Generic[OcpiResponseDataGenericType]):
-    '''
-    OCPI 4.1.7 Response format
+# Envelope fields shared by the success response examples of every module: `{'data': ..., **ENVELOPE_EXAMPLE}`.
+_EXAMPLE_TIMESTAMP = datetime(2015, 6, 30, 21, 59, 59, tzinfo=_UTC)
+ENVELOPE_EXAMPLE = {'status_code': 1000, 'timestamp': _EXAMPLE_TIMESTAMP.strftime('%Y-%m-%dT%H:%M:%SZ')}
 
 
-    '''
-    data: Annotated[OcpiResponseDataGenericType | None, Field(description='Contains the actual response data object or list of objects from each request.')] = None
-    status_code: OcpiStatusCodeEnum = Field(description='OCPI status code.')
-    status_message: Annotated[str | None, Field(description='An optional status message which may help when debugging.')] = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0), description='The time this message was generated.')
 
-    _examples: ClassVar[dict] = [
-        {'data': None, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z'},
+@cache
+def _examples() -> list[dict]:
+    return [
+        {'data': None, **ENVELOPE_EXAMPLE},
         { # Tokens GET Response with one Token object. (CPO end-point) (one object)
             "data": {
                 "country_code": "DE",
@@ -74,7 +158,7 @@ class OcpiBaseResponse(BaseModel, Generic[OcpiResponseDataGenericType]):
             },
             "status_code": 1000,
             "status_message": "Success",
-            "timestamp": "2015-06-30T21:59:59Z",
+            "timestamp": ENVELOPE_EXAMPLE['timestamp'],
         },
         { # Tokens GET Response with list of Token objects. (eMSP end-point) (list of objects)
             "data": [
@@ -117,12 +201,101 @@ class OcpiBaseResponse(BaseModel, Generic[OcpiResponseDataGenericType]):
             ],
             "status_code": 1000,
             "status_message": "Success",
-            "timestamp": "2015-06-30T21:59:59Z",
+            "timestamp": ENVELOPE_EXAMPLE['timestamp'],
         },
         { # Response with an error (contains no data field)
             "status_code": 2001,
             "status_message": "Missing required field: type",
-            "timestamp": "2015-06-30T21:59:59Z",
+            "timestamp": ENVELOPE_EXAMPLE['timestamp'],
         }
     ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+
+
+
+class OcpiBaseResponse(BaseModel, Generic[OcpiResponseDataGenericType]):
+    '''
+    OCPI 4.1.7 Response format
+
+
+    '''
+    data: Annotated[OcpiResponseDataGenericType | None, Field(description='Contains the actual response data object or list of objects from each request.')] = None
+    status_code: OcpiStatusCodeEnum = Field(description='OCPI status code.')
+    status_message: Annotated[str | None, Field(description='An optional status message which may help when debugging.')] = None
+    timestamp: datetime = Field(default_factory=cached_now, description='The time this message was generated.')
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'OcpiBaseResponse':
+        '''
+        Build the response without validation, see `construct_trusted`. Only for data that came out of our own storage.
+        '''
+        return construct_trusted(cls, data)
+
+    def to_json_bytes(self) -> bytes:
+        '''
+        Same output as `model_dump_json()`, but as the `bytes` pydantic-core produces, skipping the decode to `str` and the encode
+        back that a web framework would otherwise do.
+        '''
+        return self.__pydantic_serializer__.to_json(self)
+
+    model_config = ConfigDict(json_schema_extra=lambda schema: schema_examples(*_examples())(schema))
+
+
+
+def encode_response(data: Any, status_code: OcpiStatusCodeEnum, status_message: str | None = None) -> bytes:
+    '''
+    Serialize an OCPI response straight to JSON bytes.
+
+    Gives the same output as `OcpiBaseResponse(data=data, status_code=status_code, status_message=status_message).model_dump_json()`,
+    but the envelope is never validated or instantiated: pydantic-core serializes `data` (a model, a list of models or plain values)
+    and the envelope fields in one pass.
+    '''
+    return to_json({
+        'data': data,
+        'status_code': status_code,
+        'status_message': status_message,
+        'timestamp': cached_now(),
+    })
+
+
+
+# Short descriptions of the OCPI 5.2–5.4 error codes, sent when `encode_error_response` gets no `status_message`.
+_ERROR_MESSAGES: dict[OcpiStatusCodeEnum, str] = {
+    OcpiStatusCodeEnum.CLIENT_ERROR: 'Generic client error',
+    OcpiStatusCodeEnum.INVALID_OR_MISSING_PARAMETERS: 'Invalid or missing parameters',
+    OcpiStatusCodeEnum.NOT_ENOUGH_INFORMATION: 'Not enough information',
+    OcpiStatusCodeEnum.UNKNOWN_LOCATION: 'Unknown Location',
+    OcpiStatusCodeEnum.UNKNOWN_TOKEN: 'Unknown Token',
+    OcpiStatusCodeEnum.SERVER_ERROR: 'Generic server error',
+    OcpiStatusCodeEnum.UNABLE_TO_USE_THE_CLIENTS_API: 'Unable to use the client’s API',
+    OcpiStatusCodeEnum.UNSUPPORTED_VERSION: 'Unsupported version',
+    OcpiStatusCodeEnum.NO_MATCHING_ENDPOINTS_OR_EXPECTED_ENDPOINTS_MISSING_BETWEEN_PARTIES: 'No matching endpoints or expected endpoints missing between parties',
+    OcpiStatusCodeEnum.HUB_ERROR: 'Generic error',
+    OcpiStatusCodeEnum.UNKNOWN_RECEIVER: 'Unknown receiver',
+    OcpiStatusCodeEnum.TIMEOUT_ON_FORWARDED_REQUEST: 'Timeout on forwarded request',
+    OcpiStatusCodeEnum.CONNECTION_PROBLEM: 'Connection problem',
+}
+_TIMESTAMP_PLACEHOLDER = b'"__TIMESTAMP__"'
+_ERROR_TEMPLATES: dict[OcpiStatusCodeEnum, bytes] = {
+    status_code: to_json({
+        'status_code': status_code,
+        'status_message': status_message,
+        'timestamp': _TIMESTAMP_PLACEHOLDER[1:-1].decode(),
+    })
+    for status_code, status_message in _ERROR_MESSAGES.items()
+}
+
+
+
+def encode_error_response(status_code: OcpiStatusCodeEnum, status_message: str | None = None) -> bytes:
+    '''
+    Serialize an OCPI error response (no `data` field) straight to JSON bytes.
+
+    Without a `status_message` the body comes from a template rendered at import time with the spec's description of the code,
+    e.g. `"Invalid or missing parameters"` for 2001, and only the timestamp is filled in. That default only exists for the 2xxx–4xxx
+    error codes; other codes raise `ValueError` unless a `status_message` is given.
+    '''
+    if status_message is not None:
+        return to_json({'status_code': status_code, 'status_message': status_message, 'timestamp': cached_now()})
+    template = _ERROR_TEMPLATES.get(status_code)
+    if template is None: raise ValueError(f'No default status_message for {status_code!r}, only 2xxx–4xxx error codes have one.')
+    return template.replace(_TIMESTAMP_PLACEHOLDER, to_json(cached_now()))
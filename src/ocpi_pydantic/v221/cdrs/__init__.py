@@ -1,14 +1,68 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiPrice
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiPrice, construct_trusted, schema_examples
 from ocpi_pydantic.v221.enum import OcpiAuthMethodEnum, OcpiConnectorFormatEnum, OcpiConnectorTypeEnum, OcpiCdrDimensionTypeEnum, OcpiPowerTypeEnum, OcpiTokenTypeEnum
 from ocpi_pydantic.v221.locations import OcpiGeoLocation
 from ocpi_pydantic.v221.tariffs import OcpiTariff
 
 
 
+_CDR_EXAMPLES = [{
+    "country_code": "BE",
+    "party_id": "BEC",
+    "id": "12345",
+    "start_date_time": "2015-06-29T21:39:09Z",
+    "end_date_time": "2015-06-29T23:37:32Z",
+    "cdr_token": {"uid": "012345678", "type": "RFID", "contract_id": "DE8ACC12E46L89"},
+    "auth_method": "WHITELIST",
+    "cdr_location": {
+        "id": "LOC1",
+        "name": "Gent Zuid",
+        "address": "F.Rooseveltlaan 3A",
+        "city": "Gent",
+        "postal_code": "9000",
+        "country": "BEL",
+        "coordinates": {"latitude": "3.729944", "longitude": "51.047599"},
+        "evse_uid": "3256",
+        "evse_id": "BE*BEC*E041503003",
+        "connector_id": "1",
+        "connector_standard": "IEC_62196_T2",
+        "connector_format": "SOCKET",
+        "connector_power_type": "AC_1_PHASE"
+    },
+    "currency": "EUR",
+    "tariffs": [{
+        "country_code": "BE",
+        "party_id": "BEC",
+        "id": "12",
+        "currency": "EUR",
+        "elements": [{
+            "price_components": [{"type": "TIME", "price": 2.00, "vat": 10.0, "step_size": 300}]
+        }],
+        "last_updated": "2015-02-02T14:15:01Z"
+    }],
+    "charging_periods": [{
+        "start_date_time": "2015-06-29T21:39:09Z",
+        "dimensions": [{"type": "TIME", "volume": 1.973}],
+        "tariff_id": "12"
+    }],
+    "total_cost": {"excl_vat": 4.00, "incl_vat": 4.40},
+    "total_energy": 15.342,
+    "total_time": 1.973,
+    "total_time_cost": {"excl_vat": 4.00, "incl_vat": 4.40},
+    "last_updated": "2015-06-29T22:01:13Z"
+}]
+_CDR_RESPONSE_EXAMPLES = [{
+    'data': _CDR_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+_CDR_LIST_RESPONSE_EXAMPLES = [{
+    'data': [_CDR_EXAMPLES[0]], **ENVELOPE_EXAMPLE,
+}]
+
+
+
 class OcpiCdrToken(BaseModel):
     '''
     OCPI 10.4.5. CdrToken class
@@ -39,6 +93,13 @@ class OcpiCdrToken(BaseModel):
         ''',
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'OcpiCdrToken':
+        '''
+        Build a CdrToken without validation, see `construct_trusted`. Only for data that came out of our own storage.
+        '''
+        return construct_trusted(cls, data)
+
 
 
 class OcpiCdrDimension(BaseModel):
@@ -486,69 +547,18 @@ class OcpiCdr(BaseModel):
     last_updated: AwareDatetime = Field(description='Timestamp when this CDR was last updated (or created).')
 
 
-    _example: ClassVar[dict] = {
-        "country_code": "BE",
-        "party_id": "BEC",
-        "id": "12345",
-        "start_date_time": "2015-06-29T21:39:09Z",
-        "end_date_time": "2015-06-29T23:37:32Z",
-        "cdr_token": {"uid": "012345678", "type": "RFID", "contract_id": "DE8ACC12E46L89"},
-        "auth_method": "WHITELIST",
-        "cdr_location": {
-            "id": "LOC1",
-            "name": "Gent Zuid",
-            "address": "F.Rooseveltlaan 3A",
-            "city": "Gent",
-            "postal_code": "9000",
-            "country": "BEL",
-            "coordinates": {"latitude": "3.729944", "longitude": "51.047599"},
-            "evse_uid": "3256",
-            "evse_id": "BE*BEC*E041503003",
-            "connector_id": "1",
-            "connector_standard": "IEC_62196_T2",
-            "connector_format": "SOCKET",
-            "connector_power_type": "AC_1_PHASE"
-        },
-        "currency": "EUR",
-        "tariffs": [{
-            "country_code": "BE",
-            "party_id": "BEC",
-            "id": "12",
-            "currency": "EUR",
-            "elements": [{
-                "price_components": [{"type": "TIME", "price": 2.00, "vat": 10.0, "step_size": 300}]
-            }],
-            "last_updated": "2015-02-02T14:15:01Z"
-        }],
-        "charging_periods": [{
-            "start_date_time": "2015-06-29T21:39:09Z",
-            "dimensions": [{"type": "TIME", "volume": 1.973}],
-            "tariff_id": "12"
-        }],
-        "total_cost": {"excl_vat": 4.00, "incl_vat": 4.40},
-        "total_energy": 15.342,
-        "total_time": 1.973,
-        "total_time_cost": {"excl_vat": 4.00, "incl_vat": 4.40},
-        "last_updated": "2015-06-29T22:01:13Z"
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CDR_EXAMPLES))
 
 
 
 class OcpiCdrResponse(OcpiBaseResponse):
     data: OcpiCdr = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiCdr._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CDR_RESPONSE_EXAMPLES))
 
 
 
 class OcpiCdrListResponse(OcpiBaseResponse):
     data: list[OcpiCdr] = []
 
-    _examples: ClassVar[dict] = [{
-        'data': [OcpiCdr._example], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CDR_LIST_RESPONSE_EXAMPLES))
@@ -1,13 +1,17 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, HttpUrl, model_validator
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiDisplayText
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiDisplayText, schema_examples
 from ocpi_pydantic.v221.enum import OcpiCommandResponseTypeEnum, OcpiCommandResultTypeEnum
 from ocpi_pydantic.v221.tokens import OcpiToken
 
 
 
+_COMMAND_RESPONSE_RESPONSE_EXAMPLES = [{'data': {}, **ENVELOPE_EXAMPLE}]
+
+
+
 class OcpiCancelReservation(BaseModel):
     '''
     OCPI 13.3.1. CancelReservation Object
@@ -195,8 +199,7 @@ class OcpiCommandResponse(BaseModel):
 class OcpiCommandResponseResponse(OcpiBaseResponse):
     data: OcpiCommandResponse = ...
 
-    _examples: ClassVar[dict] = [{'data': {}, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z'}]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_COMMAND_RESPONSE_RESPONSE_EXAMPLES))
 
 
 
@@ -1,11 +1,26 @@
 
-from typing import ClassVar
-
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, schema_examples
 from ocpi_pydantic.v221.enum import OcpiPartyRoleEnum
-from ocpi_pydantic.v221.locations import OcpiBusinessDetails
+from ocpi_pydantic.v221.locations import BUSINESS_DETAILS_EXAMPLES, OcpiBusinessDetails
+
+
+
+_CREDENTIALS_ROLE_EXAMPLES = [{
+    'role': OcpiPartyRoleEnum.CPO,
+    'party_id': 'WNC',
+    'country_code': 'TW',
+    'business_details': BUSINESS_DETAILS_EXAMPLES[0],
+}]
+_CREDENTIALS_EXAMPLES = [{
+    'token': '01JM2S75MMNRXX4M5FPGA9P1AP', # ULID
+    'url': 'https://example.com/ocpi/versions',
+    'roles': [_CREDENTIALS_ROLE_EXAMPLES[0]],
+}]
+_CREDENTIALS_RESPONSE_EXAMPLES = [{ # Version details response (one object)
+    'data': _CREDENTIALS_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
 
 
 
@@ -24,13 +39,7 @@ class OcpiCredentialsRole(BaseModel):
         min_length=2, max_length=2,
     )
 
-    _example: ClassVar[dict] = {
-        'role': OcpiPartyRoleEnum.CPO,
-        'party_id': 'WNC',
-        'country_code': 'TW',
-        'business_details': OcpiBusinessDetails._example,
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CREDENTIALS_ROLE_EXAMPLES))
 
 
 
@@ -82,12 +91,7 @@ class OcpiCredentials(BaseModel):
     url: HttpUrl = Field(description='The URL to your API versions endpoint.')
     roles: list[OcpiCredentialsRole] = Field(description='List of the roles this party provides.')
 
-    _example: ClassVar[dict] = {
-        'token': '01JM2S75MMNRXX4M5FPGA9P1AP', # ULID
-        'url': 'https://example.com/ocpi/versions',
-        'roles': [OcpiCredentialsRole._example],
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CREDENTIALS_EXAMPLES))
 
 
 
@@ -95,7 +99,4 @@ class OcpiCredentials(BaseModel):
 class OcpiCredentialsResponse(OcpiBaseResponse):
     data: OcpiCredentials = ...
 
-    _examples: ClassVar[dict] = [{ # Version details response (one object)
-        'data': OcpiCredentials._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CREDENTIALS_RESPONSE_EXAMPLES))
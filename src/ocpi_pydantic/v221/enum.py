@@ -1,4 +1,5 @@
 from enum import Enum, IntEnum
+from types import MappingProxyType
 
 
 
@@ -36,6 +37,11 @@ class OcpiStatusCodeEnum(IntEnum):
 
 
 
+# Read-only `{code: member}` lookup, cheaper than calling `OcpiStatusCodeEnum(code)` on hot paths.
+STATUS_BY_CODE: MappingProxyType[int, OcpiStatusCodeEnum] = MappingProxyType({member.value: member for member in OcpiStatusCodeEnum})
+
+
+
 class OcpiPartyRoleEnum(str, Enum):
     '''
     OCPI 16.5.1 Role enum & OCPI 2.2
@@ -1,11 +1,26 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
+from ocpi_pydantic.v221.base import OcpiUrl, schema_examples
 from ocpi_pydantic.v221.enum import OcpiImageCategoryEnum
 
 
 
+_IMAGE_EXAMPLES = [{
+    'url': 'https://wnc.com.tw/wp-content/uploads/2022/07/logo_banner_blue.png',
+    'category': 'OPERATOR',
+    'type': 'png',
+}]
+BUSINESS_DETAILS_EXAMPLES = [{
+    'name': 'WNC',
+    'website': 'https://www.wnc.com.tw',
+    # 'logo': _IMAGE_EXAMPLES[0],
+}]
+_GEO_LOCATION_EXAMPLES = [{"latitude": "51.047599", "longitude": "3.729944"}]
+
+
+
 class OcpiImage(BaseModel):
     '''
     OCPI 8.4.15. Image class
@@ -23,19 +38,14 @@ class OcpiImage(BaseModel):
     Logo Dimensions: The recommended dimensions for logos are exactly 512 pixels in width height. Thumbnail representations of
     logos should be exactly 128 pixels in width and height. If not squared, thumbnails should have the same orientation as the original.
     '''
-    url: HttpUrl = Field(description='URL from where the image data can be fetched through a web browser.')
-    thumbnail: Annotated[HttpUrl | None, Field(description='URL from where a thumbnail of the image can be fetched through a webbrowser.')] = None
+    url: OcpiUrl = Field(description='URL from where the image data can be fetched through a web browser.')
+    thumbnail: Annotated[OcpiUrl | None, Field(description='URL from where a thumbnail of the image can be fetched through a webbrowser.')] = None
     category: OcpiImageCategoryEnum = Field(description='Describes what the image is used for.')
     type: str = Field(description='Image type like: gif, jpeg, png, svg.')
     width: int | None = Field(None, description='Width of the full scale image.', gt=0, le=99999)
     height: int | None = Field(None, description='Height of the full scale image.', gt=0, le=99999)
 
-    _example: ClassVar[dict] = {
-        'url': 'https://wnc.com.tw/wp-content/uploads/2022/07/logo_banner_blue.png',
-        'category': 'OPERATOR',
-        'type': 'png',
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_IMAGE_EXAMPLES))
 
 
 
@@ -47,12 +57,7 @@ class OcpiBusinessDetails(BaseModel):
     website: HttpUrl | None = Field(None, description='Link to the operator’s website.')
     logo: OcpiImage | None = Field(None, description='Image link to the operator’s logo.')
 
-    _example: ClassVar[dict] = {
-        'name': 'WNC',
-        'website': 'https://www.wnc.com.tw',
-        # 'logo': OcpiImage._example,
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*BUSINESS_DETAILS_EXAMPLES))
 
 
 
@@ -65,7 +70,15 @@ class OcpiGeoLocation(BaseModel):
     latitude: str = Field(description='Latitude of the point in decimal degree.', max_length=10)
     longitude: str = Field(description='Longitude of the point in decimal degree.', max_length=11)
 
-    _example: ClassVar[dict] = {"latitude": "51.047599", "longitude": "3.729944"}
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    # Stored as the OCPI strings so a pass-through keeps every decimal; the float views are for distance math.
+    @property
+    def latitude_float(self) -> float:
+        return float(self.latitude)
+
+    @property
+    def longitude_float(self) -> float:
+        return float(self.longitude)
+
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_GEO_LOCATION_EXAMPLES))
 
 
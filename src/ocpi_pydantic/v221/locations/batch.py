@@ -0,0 +1,86 @@
+'''
+Vectorized queries over many EVSEs.
+
+The EVSE fields that are queried are copied once into flat NumPy arrays (structure of arrays), so filters like "all EVSEs within 5 km"
+run as a single NumPy expression instead of a Python loop over `OcpiEvse` objects.
+
+Requires NumPy: `pip install ocpi-pydantic[numpy]`.
+'''
+from datetime import datetime
+
+import numpy as np
+
+from ocpi_pydantic.v221.locations.evse import OcpiEvse
+
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+
+def haversine_km(latitudes: np.ndarray, longitudes: np.ndarray, latitude: float, longitude: float) -> np.ndarray:
+    '''
+    Great-circle distance in km from (`latitude`, `longitude`) to every point of the `latitudes` / `longitudes` arrays.
+    '''
+    lat1, lon1 = np.radians(latitude), np.radians(longitude)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+
+def haversine_mask(latitudes: np.ndarray, longitudes: np.ndarray, latitude: float, longitude: float, radius_km: float) -> np.ndarray:
+    '''
+    Boolean mask of the points within `radius_km` of (`latitude`, `longitude`). `NaN` coordinates never match.
+    '''
+    return haversine_km(latitudes, longitudes, latitude, longitude) <= radius_km
+
+
+
+def bounding_box_mask(
+    latitudes: np.ndarray, longitudes: np.ndarray, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float,
+) -> np.ndarray:
+    '''
+    Boolean mask of the points inside the box, edges included. Boxes crossing the antimeridian are not supported.
+    '''
+    return (latitudes >= min_latitude) & (latitudes <= max_latitude) & (longitudes >= min_longitude) & (longitudes <= max_longitude)
+
+
+
+class OcpiEvseBatch:
+    '''
+    Columnar view over a list of EVSEs.
+
+    The arrays are built once from `evses` and are not updated when the EVSEs change. EVSEs without `coordinates` get `NaN` and
+    never match a location filter.
+    '''
+    def __init__(self, evses: list[OcpiEvse]):
+        self.evses = evses
+        self.latitudes = np.fromiter(
+            (evse.coordinates.latitude_float if evse.coordinates else np.nan for evse in evses), dtype=np.float64, count=len(evses),
+        )
+        self.longitudes = np.fromiter(
+            (evse.coordinates.longitude_float if evse.coordinates else np.nan for evse in evses), dtype=np.float64, count=len(evses),
+        )
+        self.last_updated_ms = np.fromiter(
+            (int(evse.last_updated.timestamp() * 1000) for evse in evses), dtype=np.int64, count=len(evses),
+        )
+
+
+    def select(self, mask: np.ndarray) -> list[OcpiEvse]:
+        return [self.evses[i] for i in np.flatnonzero(mask)]
+
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float) -> list[OcpiEvse]:
+        return self.select(haversine_mask(self.latitudes, self.longitudes, latitude, longitude, radius_km))
+
+
+    def within_bounding_box(self, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float) -> list[OcpiEvse]:
+        return self.select(bounding_box_mask(self.latitudes, self.longitudes, min_latitude, min_longitude, max_latitude, max_longitude))
+
+
+    def updated_since(self, since: datetime) -> list[OcpiEvse]:
+        '''
+        EVSEs whose `last_updated` is at or after `since`, which must be timezone-aware.
+        '''
+        return self.select(self.last_updated_ms >= int(since.timestamp() * 1000))
@@ -1,12 +1,24 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiUrl, construct_trusted, schema_examples
 from ocpi_pydantic.v221.enum import OcpiConnectorFormatEnum, OcpiConnectorTypeEnum, OcpiPowerTypeEnum
 
 
 
+CONNECTOR_EXAMPLES = [{
+    "id": "1",
+    "standard": OcpiConnectorTypeEnum.IEC_62196_T2,
+    "format": OcpiConnectorFormatEnum.SOCKET,
+    "tariff_ids": ["14"],
+}]
+_CONNECTOR_RESPONSE_EXAMPLES = [{
+    'data': CONNECTOR_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+
+
+
 class OcpiConnector(BaseModel):
     '''
     OCPI 8.3.3. Connector Object
@@ -54,24 +66,21 @@ class OcpiConnector(BaseModel):
     max_voltage: int = Field(description='Maximum voltage of the connector (line to neutral for AC_3_PHASE), in volt [V].', gt=0)
     max_amperage: int = Field(description='Maximum amperage of the connector, in ampere [A].', gt=0)
     max_electric_power: Annotated[int | None, Field(description='Maximum electric power that can be delivered by this connector, in Watts (W).', gt=0)] = None
-    tariff_ids: Annotated[list[str], Field(description='Identifiers of the currently valid charging tariffs.')] = []
-    terms_and_conditions: HttpUrl | None = Field(None, description='URL to the operator’s terms and conditions.')
+    tariff_ids: Annotated[list[str], Field(default_factory=list, description='Identifiers of the currently valid charging tariffs.')]
+    terms_and_conditions: OcpiUrl | None = Field(None, description='URL to the operator’s terms and conditions.')
     last_updated: AwareDatetime = Field(description='Timestamp when this Connector was last updated (or created).')
 
-    _example: ClassVar[dict] = {
-        "id": "1",
-        "standard": OcpiConnectorTypeEnum.IEC_62196_T2,
-        "format": OcpiConnectorFormatEnum.SOCKET,
-        "tariff_ids": ["14"],
-        
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'OcpiConnector':
+        '''
+        Build a Connector without validation, see `construct_trusted`. Only for data that came out of our own storage.
+        '''
+        return construct_trusted(cls, data)
+
+    model_config = ConfigDict(json_schema_extra=schema_examples(*CONNECTOR_EXAMPLES))
 
 
 class OcpiConnectorResponse(OcpiBaseResponse):
     data: OcpiConnector = ...
 
-    _examples: ClassVar[dict] = [{ # Version details response (one object)
-        'data': OcpiConnector._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_CONNECTOR_RESPONSE_EXAMPLES))
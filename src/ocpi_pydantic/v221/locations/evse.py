@@ -1,11 +1,30 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, field_serializer
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiDisplayText
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, Id36, OcpiBaseResponse, OcpiDisplayText, construct_trusted, schema_examples
 from ocpi_pydantic.v221.enum import OcpiCapabilityEnum, OcpiParkingRestrictionEnum, OcpiStatusEnum
 from ocpi_pydantic.v221.locations import OcpiGeoLocation, OcpiImage
-from ocpi_pydantic.v221.locations.connector import OcpiConnector
+from ocpi_pydantic.v221.locations.connector import CONNECTOR_EXAMPLES, OcpiConnector
+
+
+
+_EVSE_EXAMPLES = [{
+    "uid": "3256",
+    "evse_id": "BE*BEC*E041503003",
+    "status": OcpiStatusEnum.AVAILABLE,
+    "capabilities": [OcpiCapabilityEnum.RESERVABLE],
+    "connectors": CONNECTOR_EXAMPLES,
+    "floor": '-1',
+    "physical_reference": '3',
+    "last_updated": "2019-06-24T12:39:09Z",
+}]
+_EVSE_LIST_RESPONSE_EXAMPLES = [{
+    'data': _EVSE_EXAMPLES, **ENVELOPE_EXAMPLE,
+}]
+_EVSE_RESPONSE_EXAMPLES = [{
+    'data': _EVSE_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
 
 
 
@@ -25,7 +44,7 @@ class OcpiEvse(BaseModel):
     '''
     OCPI 8.3.2. EVSE Object
     '''
-    uid: str = Field(description='Uniquely identifies the EVSE within the CPOs platform (and suboperator platforms).', max_length=36)
+    uid: Id36 = Field(description='Uniquely identifies the EVSE within the CPOs platform (and suboperator platforms).')
     evse_id: Annotated[str | None, Field(
         max_length=48,
         description='''
@@ -33,45 +52,52 @@ class OcpiEvse(BaseModel):
         ''',
     )] = None
     status: OcpiStatusEnum = Field(description='Indicates the current status of the EVSE.')
-    status_schedule: Annotated[list[OcpiStatusSchedule], Field(description='Indicates a planned status update of the EVSE.')] = []
-    capabilities: list[OcpiCapabilityEnum] = Field([], description='List of functionalities that the EVSE is capable of.')
+    status_schedule: Annotated[list[OcpiStatusSchedule], Field(default_factory=list, description='Indicates a planned status update of the EVSE.')]
+    capabilities: frozenset[OcpiCapabilityEnum] = Field(frozenset(), description='List of functionalities that the EVSE is capable of.')
     connectors: list[OcpiConnector] = Field(description='List of available connectors on the EVSE.', min_length=1)
     floor_level: str | None = Field(None, description='Level on which the Charge Point is located (in garage buildings) in the locally displayed numbering scheme.', max_length=4)
     coordinates: OcpiGeoLocation | None = Field(None, description='Coordinates of the EVSE.')
     physical_reference: str | None = Field(None, description='A number/string printed on the outside of the EVSE for visual identification.', max_length=16)
-    directions: list[OcpiDisplayText] = Field([], description='Multi-language human-readable directions when more detailed information on how to reach the EVSE from the Location is required.')
-    parking_restrictions: list[OcpiParkingRestrictionEnum] | None = Field(None, description='The restrictions that apply to the parking spot.')
-    images: list[OcpiImage] = Field([], description='Links to images related to the EVSE such as photos or logos.')
+    directions: list[OcpiDisplayText] = Field(default_factory=list, description='Multi-language human-readable directions when more detailed information on how to reach the EVSE from the Location is required.')
+    parking_restrictions: frozenset[OcpiParkingRestrictionEnum] | None = Field(None, description='The restrictions that apply to the parking spot.')
+    images: list[OcpiImage] = Field(default_factory=list, description='Links to images related to the EVSE such as photos or logos.')
     last_updated: AwareDatetime = Field(description='Timestamp when this EVSE or one of its Connectors was last updated (or created).')
 
-    _example: ClassVar[dict] = {
-        "uid": "3256",
-        "evse_id": "BE*BEC*E041503003",
-        "status": OcpiStatusEnum.AVAILABLE,
-        "capabilities": [OcpiCapabilityEnum.RESERVABLE],
-        "connectors": [OcpiConnector._example],
-        "floor": '-1',
-        "physical_reference": '3',
-        "last_updated": "2019-06-24T12:39:09Z",
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'OcpiEvse':
+        '''
+        Build an EVSE without validation, see `construct_trusted`. The `connectors`, `status_schedule`, `directions` and `images`
+        entries are built as their models too. Only for data that came out of our own storage.
+        '''
+        return construct_trusted(cls, data)
+
+    @field_serializer('capabilities')
+    def serialize_capabilities(self, value: frozenset[OcpiCapabilityEnum]) -> list[OcpiCapabilityEnum]:
+        '''
+        Dump the set as a list in enum declaration order, so the output does not depend on set iteration order.
+        '''
+        return [member for member in OcpiCapabilityEnum if member in value]
+
+    @field_serializer('parking_restrictions')
+    def serialize_parking_restrictions(self, value: frozenset[OcpiParkingRestrictionEnum] | None) -> list[OcpiParkingRestrictionEnum] | None:
+        '''
+        Dump the set as a list in enum declaration order, like `capabilities`.
+        '''
+        if value is None: return None
+        return [member for member in OcpiParkingRestrictionEnum if member in value]
+
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_EVSE_EXAMPLES))
 
 
 
 class OcpiEvseListResponse(OcpiBaseResponse):
     data: list[OcpiEvse] = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': [OcpiEvse._example], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_EVSE_LIST_RESPONSE_EXAMPLES))
 
 
 
 class OcpiEvseResponse(OcpiBaseResponse):
     data: OcpiEvse = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiEvse._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_EVSE_RESPONSE_EXAMPLES))
@@ -1,15 +1,331 @@
 from datetime import datetime, timezone
-from typing import Annotated, ClassVar
+from typing import Annotated
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiDisplayText
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiDisplayText, schema_examples
 from ocpi_pydantic.v221.enum import OcpiEnergySourceCategoryEnum, OcpiEnvironmentalImpactCategoryEnum, OcpiFacilityEnum, OcpiParkingTypeEnum, OcpiTokenTypeEnum
 from ocpi_pydantic.v221.locations import OcpiBusinessDetails, OcpiGeoLocation, OcpiImage
 from ocpi_pydantic.v221.locations.evse import OcpiEvse
 
 
 
+_REGULAR_HOURS_EXAMPLES = [{"weekday": 1, "period_begin": "08:00", "period_end": "20:00"}]
+_EXCEPTIONAL_PERIOD_EXAMPLES = [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}]
+_HOURS_EXAMPLES = [
+    # 8.4.14.1. Example: 24/7 open with exceptional closing.
+    {"twentyfourseven": True, "exceptional_closings": [{"period_begin": "2018-12-25T03:00:00Z", "period_end": "2018-12-25T05:00:00Z"}]},
+    # 8.4.14.2. Example: Opening Hours with exceptional closing.
+    {
+        "twentyfourseven": False,
+        "regular_hours": [
+            {"weekday": 1, "period_begin": "01:00", "period_end": "06:00"},
+            {"weekday": 2, "period_begin": "01:00", "period_end": "06:00"},
+        ],
+        "exceptional_closings": [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}],
+    },
+    # 8.4.14.3. Example: Opening Hours with exceptional opening.
+    {
+        "twentyfourseven": False,
+        "regular_hours": [
+            {"weekday": 1, "period_begin": "00:00", "period_end": "04:00"},
+            {"weekday": 2, "period_begin": "00:00", "period_end": "04:00"}
+        ],
+        "exceptional_openings": [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}],
+    },
+]
+_ADDITIONAL_GEO_LOCATION_EXAMPLES = [{"latitude": "51.047599", "longitude": "3.729944"}]
+_ENERGY_MIX_EXAMPLES = [
+    # Simple
+    {"is_green_energy": True},
+    # Tariff energy provider name
+    {"is_green_energy": True, "supplier_name": "Greenpeace Energy eG", "energy_product_name": "eco-power"},
+    # Complete
+    {
+        "is_green_energy": False,
+        "energy_sources": [
+            { "source": "GENERAL_GREEN", "percentage": 35.9 },
+            { "source": "GAS", "percentage": 6.3 },
+            { "source": "COAL", "percentage": 33.2 },
+            { "source": "GENERAL_FOSSIL", "percentage": 2.9 },
+            { "source": "NUCLEAR", "percentage": 21.7 },
+        ],
+        "environ_impact": [
+            { "category": "NUCLEAR_WASTE", "amount": 0.0006 },
+            { "category": "CARBON_DIOXIDE", "amount": 372 },
+        ],
+        "supplier_name": "E.ON Energy Deutschland",
+        "energy_product_name": "E.ON DirektStrom eco",
+    },
+]
+_LOCATION_EXAMPLES = [
+    { # 8.3.1.1. Example public charging location
+        "country_code": "BE",
+        "party_id": "BEC",
+        "id": "LOC1",
+        "name": "Gent Zuid",
+
+        "publish": True,
+
+        "time_zone": "Europe/Brussels",
+        "coordinates": {"latitude": "51.047599", "longitude": "3.729944"},
+        "postal_code": "9000",
+        "country": "BEL",
+        "city": "Gent",
+        "address": "F.Rooseveltlaan 3A",
+
+        "parking_type": "ON_STREET",
+        "evses": [
+            {
+                "uid": "3256",
+                "evse_id": "BE*BEC*E041503001",
+                "status": "AVAILABLE",
+                "capabilities": ["RESERVABLE"],
+                "connectors": [
+                    {
+                        "id": "1",
+                        "standard": "IEC_62196_T2",
+                        "format": "CABLE",
+                        "power_type": "AC_3_PHASE",
+                        "max_voltage": 220,
+                        "max_amperage": 16,
+                        "tariff_ids": ["11"],
+                        "last_updated": "2015-03-16T10:10:02Z"
+                    },
+                    {
+                        "id": "2",
+                        "standard": "IEC_62196_T2",
+                        "format": "SOCKET",
+                        "power_type": "AC_3_PHASE",
+                        "max_voltage": 220,
+                        "max_amperage": 16,
+                        "tariff_ids": ["13"],
+                        "last_updated": "2015-03-18T08:12:01Z"
+                    }
+                ],
+                    "physical_reference": "1",
+                    "floor_level": "-1",
+                    "last_updated": "2015-06-28T08:12:01Z"
+                },
+            {
+                "uid": "3257",
+                "evse_id": "BE*BEC*E041503002",
+                "status": "RESERVED",
+                "capabilities": [
+                    "RESERVABLE"
+                ],
+                "connectors": [{
+                    "id": "1",
+                    "standard": "IEC_62196_T2",
+                    "format": "SOCKET",
+                    "power_type": "AC_3_PHASE",
+                    "max_voltage": 220,
+                    "max_amperage": 16,
+                    "tariff_ids": ["12"],
+                    "last_updated": "2015-06-29T20:39:09Z"
+                }],
+                "physical_reference": "2",
+                "floor_level": "-2",
+                "last_updated": "2015-06-29T20:39:09Z"
+            }
+        ],
+        "operator": {"name": "BeCharged"},
+        "last_updated": "2015-06-29T20:39:09Z"
+    },
+    { # 8.3.1.2. Example destination charging location
+        "country_code": "NL",
+        "party_id": "ALF",
+        "id": "3e7b39c2-10d0-4138-a8b3-8509a25f9920",
+        "name": "ihomer",
+
+        "publish": True,
+
+        "time_zone": "Europe/Amsterdam",
+        "coordinates": {"latitude": "51.562787", "longitude": "4.638975"},
+        "postal_code": "4876 BS",
+        "country": "NLD",
+        "city": "Etten-Leur",
+        "address": "Tamboerijn 7",
+
+        "parking_type": "PARKING_LOT",
+        "evses": [{
+            "uid": "fd855359-bc81-47bb-bb89-849ae3dac89e",
+            "evse_id": "NL*ALF*E000000001",
+            "status": "AVAILABLE",
+            "connectors": [{
+                "id": "1",
+                "standard": "IEC_62196_T2",
+                "format": "SOCKET",
+                "power_type": "AC_3_PHASE",
+                "max_voltage": 220,
+                "max_amperage": 16,
+                "last_updated": "2019-07-01T12:12:11Z"
+            }],
+            "parking_restrictions": [ "CUSTOMERS" ],
+            "last_updated": "2019-07-01T12:12:11Z",
+        }],
+        "last_updated": "2019-07-01T12:12:11Z",
+    },
+    { # 8.3.1.3. Example destination charging location not published, but paid guest usage possible
+        "country_code": "NL",
+        "party_id": "ALF",
+        "id": "3e7b39c2-10d0-4138-a8b3-8509a25f9920",
+        "name": "ihomer",
+
+        "publish": False,
+
+        "time_zone": "Europe/Amsterdam",
+        "coordinates": {"latitude": "51.562787","longitude": "4.638975"},
+        "postal_code": "4876 BS",
+        "country": "NLD",
+        "city": "Etten-Leur",
+        "address": "Tamboerijn 7",
+
+        "evses": [{
+            "uid": "fd855359-bc81-47bb-bb89-849ae3dac89e",
+            "evse_id": "NL*ALF*E000000001",
+            "status": "AVAILABLE",
+            "connectors": [{
+                "id": "1",
+                "standard": "IEC_62196_T2",
+                "format": "SOCKET",
+                "power_type": "AC_3_PHASE",
+                "max_voltage": 220,
+                "max_amperage": 16,
+                "last_updated": "2019-07-01T12:12:11Z",
+            }],
+            "parking_restrictions": [ "CUSTOMERS" ],
+            "last_updated": "2019-07-01T12:12:11Z",
+        }],
+        "last_updated": "2019-07-01T12:12:11Z"
+    },
+    { # 8.3.1.4. Example charging location with limited visibility
+        "country_code": "NL",
+        "party_id": "ALL",
+        "id": "f76c2e0c-a6ef-4f67-bf23-6a187e5ca0e0",
+        "name": "Water State",
+
+        "publish": False,
+        "publish_allowed_to": [
+            {"visual_number": "12345-67", "issuer": "NewMotion"},
+            {"visual_number": "0055375624", "issuer": "ANWB"},
+            {"uid": "12345678905880", "type": "RFID"},
+        ],
+
+        "time_zone": "Europe/Amsterdam",
+        "coordinates": {"latitude": "53.213763", "longitude": "5.804638"},
+        "postal_code": "8923 EM",
+        "country": "NLD",
+        "city": "Leeuwarden",
+        "address": "Taco van der Veenplein 12",
+
+        "parking_type": "UNDERGROUND_GARAGE",
+        "evses": [{
+            "uid": "8c1b3487-61ac-40a7-a367-21eee99dbd90",
+            "evse_id": "NL*ALL*EGO0000013",
+            "status": "AVAILABLE",
+            "connectors": [{
+                "id": "1",
+                "standard": "IEC_62196_T2",
+                "format": "SOCKET",
+                "power_type": "AC_3_PHASE",
+                "max_voltage": 230,
+                "max_amperage": 16,
+                "last_updated": "2019-09-27T00:19:45Z",
+            }],
+            "last_updated": "2019-09-27T00:19:45Z"
+        }],
+        "last_updated": "2019-09-27T00:19:45Z",
+    },
+    { # 8.3.1.5. Example private charge point with eMSP app control
+        "country_code": "DE",
+        "party_id": "ALL",
+        "id": "a5295927-09b9-4a71-b4b9-a5fffdfa0b77",
+
+        "publish": False,
+        "publish_allowed_to": [{"visual_number": "0123456-99", "issuer": "MoveMove"}],
+
+        "time_zone": "Europe/Berlin",
+        "coordinates": {"latitude": "50.931826", "longitude": "6.964043"},
+        "postal_code": "50931",
+        "country": "DEU",
+        "city": "Köln",
+        "address": "Krautwigstraße 283A",
+
+        "parking_type": "ON_DRIVEWAY",
+        "evses": [{
+            "uid": "4534ad5f-45be-428b-bfd0-fa489dda932d",
+            "evse_id": "DE*ALL*EGO0000001",
+            "status": "AVAILABLE",
+            "connectors": [{
+                "id": "1",
+                "standard": "IEC_62196_T2",
+                "format": "SOCKET",
+                "power_type": "AC_1_PHASE",
+                "max_voltage": 230,
+                "max_amperage": 8,
+                "last_updated": "2019-04-05T17:17:56Z"
+            }],
+            "last_updated": "2019-04-05T17:17:56Z",
+        }],
+        "last_updated": "2019-04-05T17:17:56Z"
+    },
+    { # 8.3.1.6. Example charge point in a parking garage with opening hours
+        "country_code": "SE",
+        "party_id": "EVC",
+        "id": "cbb0df21-d17d-40ba-a4aa-dc588c8f98cb",
+        "name": "P-Huset Leonard",
+
+        "publish": True,
+
+        "time_zone": "Europe/Stockholm",
+        "coordinates": {"latitude": "55.590325", "longitude": "13.008307"},
+        "postal_code": "214 26",
+        "country": "SWE",
+        "city": "Malmö",
+        "address": "Claesgatan 6",
+        "opening_times": {
+            "twentyfourseven": False,
+            "regular_hours": [
+                {"weekday": 1, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 2, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 3, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 4, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 5, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 6, "period_begin": "07:00", "period_end": "18:00"},
+                {"weekday": 7, "period_begin": "07:00", "period_end": "18:00"},
+            ],
+        },
+        "charging_when_closed": True,
+
+        "parking_type": "PARKING_GARAGE",
+        "evses": [{
+            "uid": "eccb8dd9-4189-433e-b100-cc0945dd17dc",
+            "evse_id": "SE*EVC*E000000123",
+            "status": "AVAILABLE",
+            "connectors": [{
+                "id": "1",
+                "standard": "IEC_62196_T2",
+                "format": "SOCKET",
+                "power_type": "AC_3_PHASE",
+                "max_voltage": 230,
+                "max_amperage": 32,
+                "last_updated": "2017-03-07T02:21:22Z",
+            }],
+            "last_updated": "2017-03-07T02:21:22Z"
+        }],
+        "last_updated": "2017-03-07T02:21:22Z"
+    },
+]
+_LOCATION_LIST_RESPONSE_EXAMPLES = [{
+    'data': [_LOCATION_EXAMPLES[0]], **ENVELOPE_EXAMPLE,
+}]
+_LOCATION_RESPONSE_EXAMPLES = [{
+    'data': _LOCATION_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+
+
+
 class OcpiPublishTokenType(BaseModel):
     '''
     OCPI 8.4.20. PublishTokenType class
@@ -54,8 +370,7 @@ class OcpiRegularHours(BaseModel):
     period_begin: str = Field(description='Begin of the regular period, in local time, given in hours and minutes.')
     period_end: str = Field(description='End of the regular period, in local time, syntax as for period_begin.')
 
-    _example: ClassVar[dict] = {"weekday": 1, "period_begin": "08:00", "period_end": "20:00"}
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_REGULAR_HOURS_EXAMPLES))
 
 
 
@@ -78,8 +393,7 @@ class OcpiExceptionalPeriod(BaseModel):
         if not dt.tzinfo: dt = dt.replace(tzinfo=timezone.utc)
         return dt
     
-    _examples: ClassVar[list[dict]] = [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_EXCEPTIONAL_PERIOD_EXAMPLES))
 
 
 
@@ -92,29 +406,7 @@ class OcpiHours(BaseModel):
     exceptional_openings: list[OcpiExceptionalPeriod] = Field([], description='Exceptions for specified calendar dates, time-range based.')
     exceptional_closings: list[OcpiExceptionalPeriod] = Field([], description='Exceptions for specified calendar dates, time-range based.')
 
-    _examples: ClassVar[list[dict]] = [
-        # 8.4.14.1. Example: 24/7 open with exceptional closing.
-        {"twentyfourseven": True, "exceptional_closings": [{"period_begin": "2018-12-25T03:00:00Z", "period_end": "2018-12-25T05:00:00Z"}]},
-        # 8.4.14.2. Example: Opening Hours with exceptional closing.
-        {
-            "twentyfourseven": False,
-            "regular_hours": [
-                {"weekday": 1, "period_begin": "01:00", "period_end": "06:00"},
-                {"weekday": 2, "period_begin": "01:00", "period_end": "06:00"},
-            ],
-            "exceptional_closings": [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}],
-        },
-        # 8.4.14.3. Example: Opening Hours with exceptional opening.
-        {
-            "twentyfourseven": False,
-            "regular_hours": [
-                {"weekday": 1, "period_begin": "00:00", "period_end": "04:00"},
-                {"weekday": 2, "period_begin": "00:00", "period_end": "04:00"}
-            ],
-            "exceptional_openings": [{'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z'}],
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_HOURS_EXAMPLES))
 
 
 
@@ -138,8 +430,7 @@ class AdditionalGeoLocation(BaseModel):
     longitude: str = Field(description='Longitude of the point in decimal degree.', max_length=11)
     name: OcpiDisplayText | None = Field(None, description='Name of the point in local language or as written at the location.')
 
-    _example: ClassVar[dict] = {"latitude": "51.047599", "longitude": "3.729944"}
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_ADDITIONAL_GEO_LOCATION_EXAMPLES))
 
 
 
@@ -173,30 +464,7 @@ class OcpiEnergyMix(BaseModel):
     supplier_name: str | None = Field(None, description='Name of the energy supplier, delivering the energy for this location or tariff.', max_length=64)
     evergy_product_name: str | None = Field(None, description='Name of the energy suppliers product/tariff plan used at this location.', max_length=64)
 
-    _examples: ClassVar[list[dict]] = [
-        # Simple
-        {"is_green_energy": True},
-        # Tariff energy provider name
-        {"is_green_energy": True, "supplier_name": "Greenpeace Energy eG", "energy_product_name": "eco-power"},
-        # Complete
-        {
-            "is_green_energy": False,
-            "energy_sources": [
-                { "source": "GENERAL_GREEN", "percentage": 35.9 },
-                { "source": "GAS", "percentage": 6.3 },
-                { "source": "COAL", "percentage": 33.2 },
-                { "source": "GENERAL_FOSSIL", "percentage": 2.9 },
-                { "source": "NUCLEAR", "percentage": 21.7 },
-            ],
-            "environ_impact": [
-                { "category": "NUCLEAR_WASTE", "amount": 0.0006 },
-                { "category": "CARBON_DIOXIDE", "amount": 372 },
-            ],
-            "supplier_name": "E.ON Energy Deutschland",
-            "energy_product_name": "E.ON DirektStrom eco",
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_ENERGY_MIX_EXAMPLES))
 
 
 
@@ -256,266 +524,7 @@ class OcpiLocation(BaseModel):
     energy_mix: Annotated[OcpiEnergyMix | None, Field(description='Details on the energy supplied at this location.')] = None
     last_updated: AwareDatetime = Field(description='Timestamp when this Location or one of its EVSEs or Connectors were last updated (or created).')
 
-    _examples: ClassVar[list[dict]] = [
-        { # 8.3.1.1. Example public charging location
-            "country_code": "BE",
-            "party_id": "BEC",
-            "id": "LOC1",
-            "name": "Gent Zuid",
-
-            "publish": True,
-
-            "time_zone": "Europe/Brussels",
-            "coordinates": {"latitude": "51.047599", "longitude": "3.729944"},
-            "postal_code": "9000",
-            "country": "BEL",
-            "city": "Gent",
-            "address": "F.Rooseveltlaan 3A",
-
-            "parking_type": "ON_STREET",
-            "evses": [
-                {
-                    "uid": "3256",
-                    "evse_id": "BE*BEC*E041503001",
-                    "status": "AVAILABLE",
-                    "capabilities": ["RESERVABLE"],
-                    "connectors": [
-                        {
-                            "id": "1",
-                            "standard": "IEC_62196_T2",
-                            "format": "CABLE",
-                            "power_type": "AC_3_PHASE",
-                            "max_voltage": 220,
-                            "max_amperage": 16,
-                            "tariff_ids": ["11"],
-                            "last_updated": "2015-03-16T10:10:02Z"
-                        },
-                        {
-                            "id": "2",
-                            "standard": "IEC_62196_T2",
-                            "format": "SOCKET",
-                            "power_type": "AC_3_PHASE",
-                            "max_voltage": 220,
-                            "max_amperage": 16,
-                            "tariff_ids": ["13"],
-                            "last_updated": "2015-03-18T08:12:01Z"
-                        }
-                    ],
-                        "physical_reference": "1",
-                        "floor_level": "-1",
-                        "last_updated": "2015-06-28T08:12:01Z"
-                    },
-                {
-                    "uid": "3257",
-                    "evse_id": "BE*BEC*E041503002",
-                    "status": "RESERVED",
-                    "capabilities": [
-                        "RESERVABLE"
-                    ],
-                    "connectors": [{
-                        "id": "1",
-                        "standard": "IEC_62196_T2",
-                        "format": "SOCKET",
-                        "power_type": "AC_3_PHASE",
-                        "max_voltage": 220,
-                        "max_amperage": 16,
-                        "tariff_ids": ["12"],
-                        "last_updated": "2015-06-29T20:39:09Z"
-                    }],
-                    "physical_reference": "2",
-                    "floor_level": "-2",
-                    "last_updated": "2015-06-29T20:39:09Z"
-                }
-            ],
-            "operator": {"name": "BeCharged"},
-            "last_updated": "2015-06-29T20:39:09Z"
-        },
-        { # 8.3.1.2. Example destination charging location
-            "country_code": "NL",
-            "party_id": "ALF",
-            "id": "3e7b39c2-10d0-4138-a8b3-8509a25f9920",
-            "name": "ihomer",
-
-            "publish": True,
-
-            "time_zone": "Europe/Amsterdam",
-            "coordinates": {"latitude": "51.562787", "longitude": "4.638975"},
-            "postal_code": "4876 BS",
-            "country": "NLD",
-            "city": "Etten-Leur",
-            "address": "Tamboerijn 7",
-
-            "parking_type": "PARKING_LOT",
-            "evses": [{
-                "uid": "fd855359-bc81-47bb-bb89-849ae3dac89e",
-                "evse_id": "NL*ALF*E000000001",
-                "status": "AVAILABLE",
-                "connectors": [{
-                    "id": "1",
-                    "standard": "IEC_62196_T2",
-                    "format": "SOCKET",
-                    "power_type": "AC_3_PHASE",
-                    "max_voltage": 220,
-                    "max_amperage": 16,
-                    "last_updated": "2019-07-01T12:12:11Z"
-                }],
-                "parking_restrictions": [ "CUSTOMERS" ],
-                "last_updated": "2019-07-01T12:12:11Z",
-            }],
-            "last_updated": "2019-07-01T12:12:11Z",
-        },
-        { # 8.3.1.3. Example destination charging location not published, but paid guest usage possible
-            "country_code": "NL",
-            "party_id": "ALF",
-            "id": "3e7b39c2-10d0-4138-a8b3-8509a25f9920",
-            "name": "ihomer",
-
-            "publish": False,
-
-            "time_zone": "Europe/Amsterdam",
-            "coordinates": {"latitude": "51.562787","longitude": "4.638975"},
-            "postal_code": "4876 BS",
-            "country": "NLD",
-            "city": "Etten-Leur",
-            "address": "Tamboerijn 7",
-
-            "evses": [{
-                "uid": "fd855359-bc81-47bb-bb89-849ae3dac89e",
-                "evse_id": "NL*ALF*E000000001",
-                "status": "AVAILABLE",
-                "connectors": [{
-                    "id": "1",
-                    "standard": "IEC_62196_T2",
-                    "format": "SOCKET",
-                    "power_type": "AC_3_PHASE",
-                    "max_voltage": 220,
-                    "max_amperage": 16,
-                    "last_updated": "2019-07-01T12:12:11Z",
-                }],
-                "parking_restrictions": [ "CUSTOMERS" ],
-                "last_updated": "2019-07-01T12:12:11Z",
-            }],
-            "last_updated": "2019-07-01T12:12:11Z"
-        },
-        { # 8.3.1.4. Example charging location with limited visibility
-            "country_code": "NL",
-            "party_id": "ALL",
-            "id": "f76c2e0c-a6ef-4f67-bf23-6a187e5ca0e0",
-            "name": "Water State",
-
-            "publish": False,
-            "publish_allowed_to": [
-                {"visual_number": "12345-67", "issuer": "NewMotion"},
-                {"visual_number": "0055375624", "issuer": "ANWB"},
-                {"uid": "12345678905880", "type": "RFID"},
-            ],
-
-            "time_zone": "Europe/Amsterdam",
-            "coordinates": {"latitude": "53.213763", "longitude": "5.804638"},
-            "postal_code": "8923 EM",
-            "country": "NLD",
-            "city": "Leeuwarden",
-            "address": "Taco van der Veenplein 12",
-
-            "parking_type": "UNDERGROUND_GARAGE",
-            "evses": [{
-                "uid": "8c1b3487-61ac-40a7-a367-21eee99dbd90",
-                "evse_id": "NL*ALL*EGO0000013",
-                "status": "AVAILABLE",
-                "connectors": [{
-                    "id": "1",
-                    "standard": "IEC_62196_T2",
-                    "format": "SOCKET",
-                    "power_type": "AC_3_PHASE",
-                    "max_voltage": 230,
-                    "max_amperage": 16,
-                    "last_updated": "2019-09-27T00:19:45Z",
-                }],
-                "last_updated": "2019-09-27T00:19:45Z"
-            }],
-            "last_updated": "2019-09-27T00:19:45Z",
-        },
-        { # 8.3.1.5. Example private charge point with eMSP app control
-            "country_code": "DE",
-            "party_id": "ALL",
-            "id": "a5295927-09b9-4a71-b4b9-a5fffdfa0b77",
-
-            "publish": False,
-            "publish_allowed_to": [{"visual_number": "0123456-99", "issuer": "MoveMove"}],
-
-            "time_zone": "Europe/Berlin",
-            "coordinates": {"latitude": "50.931826", "longitude": "6.964043"},
-            "postal_code": "50931",
-            "country": "DEU",
-            "city": "Köln",
-            "address": "Krautwigstraße 283A",
-
-            "parking_type": "ON_DRIVEWAY",
-            "evses": [{
-                "uid": "4534ad5f-45be-428b-bfd0-fa489dda932d",
-                "evse_id": "DE*ALL*EGO0000001",
-                "status": "AVAILABLE",
-                "connectors": [{
-                    "id": "1",
-                    "standard": "IEC_62196_T2",
-                    "format": "SOCKET",
-                    "power_type": "AC_1_PHASE",
-                    "max_voltage": 230,
-                    "max_amperage": 8,
-                    "last_updated": "2019-04-05T17:17:56Z"
-                }],
-                "last_updated": "2019-04-05T17:17:56Z",
-            }],
-            "last_updated": "2019-04-05T17:17:56Z"
-        },
-        { # 8.3.1.6. Example charge point in a parking garage with opening hours
-            "country_code": "SE",
-            "party_id": "EVC",
-            "id": "cbb0df21-d17d-40ba-a4aa-dc588c8f98cb",
-            "name": "P-Huset Leonard",
-
-            "publish": True,
-
-            "time_zone": "Europe/Stockholm",
-            "coordinates": {"latitude": "55.590325", "longitude": "13.008307"},
-            "postal_code": "214 26",
-            "country": "SWE",
-            "city": "Malmö",
-            "address": "Claesgatan 6",
-            "opening_times": {
-                "twentyfourseven": False,
-                "regular_hours": [
-                    {"weekday": 1, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 2, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 3, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 4, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 5, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 6, "period_begin": "07:00", "period_end": "18:00"},
-                    {"weekday": 7, "period_begin": "07:00", "period_end": "18:00"},
-                ],
-            },
-            "charging_when_closed": True,
-
-            "parking_type": "PARKING_GARAGE",
-            "evses": [{
-                "uid": "eccb8dd9-4189-433e-b100-cc0945dd17dc",
-                "evse_id": "SE*EVC*E000000123",
-                "status": "AVAILABLE",
-                "connectors": [{
-                    "id": "1",
-                    "standard": "IEC_62196_T2",
-                    "format": "SOCKET",
-                    "power_type": "AC_3_PHASE",
-                    "max_voltage": 230,
-                    "max_amperage": 32,
-                    "last_updated": "2017-03-07T02:21:22Z",
-                }],
-                "last_updated": "2017-03-07T02:21:22Z"
-            }],
-            "last_updated": "2017-03-07T02:21:22Z"
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_LOCATION_EXAMPLES))
 
 
 
@@ -523,17 +532,11 @@ class OcpiLocation(BaseModel):
 class OcpiLocationListResponse(OcpiBaseResponse):
     data: list[OcpiLocation] = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': [OcpiLocation._examples[0]], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_LOCATION_LIST_RESPONSE_EXAMPLES))
 
 
 
 class OcpiLocationResponse(OcpiBaseResponse):
     data: OcpiLocation = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiLocation._examples[0], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_LOCATION_RESPONSE_EXAMPLES))
\ No newline at end of file
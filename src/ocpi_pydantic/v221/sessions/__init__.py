@@ -1,10 +1,69 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, TypeAdapter
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiPrice
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, CountryCode, Currency, Id36, OcpiBaseResponse, OcpiPrice, PartyId, construct_trusted, schema_examples
 from ocpi_pydantic.v221.cdrs import OcpiCdrToken, OcpiChargingPeriod
-from ocpi_pydantic.v221.enum import OcpiAuthMethodEnum, OcpiChargingPreferencesResponseEnum, OcpiProfileTypeEnum, OcpiSessionStatusEnum
+from ocpi_pydantic.v221.enum import OcpiAuthMethodEnum, OcpiChargingPreferencesResponseEnum, OcpiProfileTypeEnum, OcpiSessionStatusEnum, OcpiStatusCodeEnum
+
+
+
+_SESSION_EXAMPLES = [
+    { # Simple Session example of just starting a session
+        "country_code": "NL",
+        "party_id": "STK",
+        "id": "101",
+        "start_date_time": "2020-03-09T10:17:09Z",
+        "kwh": 0.0,
+        "cdr_token": {"uid": "123abc", "type": "RFID", "contract_id": "NL-TST-C12345678-S"},
+        "auth_method": "WHITELIST",
+        "location_id": "LOC1",
+        "evse_uid": "3256",
+        "connector_id": "1",
+        "currency": "EUR",
+        "total_cost": {"excl_vat": 2.5},
+        "status": "PENDING",
+        "last_updated": "2020-03-09T10:17:09Z"
+    },
+    { # Simple Session example of a short finished session
+        "country_code": "BE",
+        "party_id": "BEC",
+        "id": "101",
+        "start_date_time": "2015-06-29T22:39:09Z",
+        "end_date_time": "2015-06-29T23:50:16Z",
+        "kwh": 41.00,
+        "cdr_token": {"uid": "123abc", "type": "RFID", "contract_id": "NL-TST-C12345678-S"},
+        "auth_method": "WHITELIST",
+        "location_id": "LOC1",
+        "evse_uid": "3256",
+        "connector_id": "1",
+        "currency": "EUR",
+        "charging_periods": [
+            {
+                "start_date_time": "2015-06-29T22:39:09Z",
+                "dimensions": [{"type": "ENERGY", "volume": 120}, {"type": "MAX_CURRENT", "volume": 30}]
+            },
+            {
+                "start_date_time": "2015-06-29T22:40:54Z",
+                "dimensions": [{"type": "ENERGY", "volume": 41000}, {"type": "MIN_CURRENT", "volume": 34}]
+            },
+            {
+                "start_date_time": "2015-06-29T23:07:09Z",
+                "dimensions": [{"type": "PARKING_TIME", "volume": 0.718}],
+                "tariff_id": "12"
+            }
+        ],
+        "total_cost": {"excl_vat": 8.50, "incl_vat": 9.35},
+        "status": "COMPLETED",
+        "last_updated": "2015-06-29T23:50:17Z"
+    },
+]
+_SESSION_RESPONSE_EXAMPLES = [{
+    'data': _SESSION_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+_SESSION_LIST_RESPONSE_EXAMPLES = [{
+    'data': [_SESSION_EXAMPLES[0]], **ENVELOPE_EXAMPLE,
+}]
 
 
 
@@ -39,9 +98,9 @@ class OcpiSession(BaseModel):
     `authorization_reference` then the value returned by a real-time authorization.
     '''
 
-    country_code: str = Field(min_length=2, max_length=2, description="ISO-3166 alpha-2 country code of the CPO that 'owns' this Session.")
-    party_id: str = Field(min_length=3, max_length=3, description="ID of the CPO that 'owns' this Session (following the ISO-15118 standard).")
-    id: str = Field(max_length=36, description='The unique id that identifies the charging session in the CPO platform.')
+    country_code: CountryCode = Field(description="ISO-3166 alpha-2 country code of the CPO that 'owns' this Session.")
+    party_id: PartyId = Field(description="ID of the CPO that 'owns' this Session (following the ISO-15118 standard).")
+    id: Id36 = Field(description='The unique id that identifies the charging session in the CPO platform.')
     start_date_time: AwareDatetime = Field(
         description='''
         The timestamp when the session became ACTIVE in the Charge
@@ -59,7 +118,7 @@ class OcpiSession(BaseModel):
         but parking cost also has to be paid.
         ''',
     )] = None
-    kwh: float = Field(description='How many kWh were charged.')
+    kwh: float = Field(ge=0, description='How many kWh were charged.')
     cdr_token: OcpiCdrToken = Field(
         description='''
         Token used to start this charging session, including all the relevant
@@ -74,8 +133,7 @@ class OcpiSession(BaseModel):
         starts charging using a Token that is whitelisted: `WHITELIST`.
         ''',
     )
-    authorization_reference: Annotated[str | None, Field(
-        max_length=36,
+    authorization_reference: Annotated[Id36 | None, Field(
         description='''
         Reference to the authorization given by the eMSP. When the eMSP
         provided an `authorization_reference` in either: real-time
@@ -86,9 +144,8 @@ class OcpiSession(BaseModel):
         be used here.
         ''',
     )] = None
-    location_id: str = Field(max_length=36, description='Location.id of the Location object of this CPO, on which the charging session is/was happening.')
-    evse_uid : str = Field(
-        max_length=36,
+    location_id: Id36 = Field(description='Location.id of the Location object of this CPO, on which the charging session is/was happening.')
+    evse_uid : Id36 = Field(
         description='''
         EVSE.uid of the EVSE of this Location on which the charging
         session is/was happening. Allowed to be set to: `#NA` when this
@@ -96,8 +153,7 @@ class OcpiSession(BaseModel):
         the driver.
         ''',
     )
-    connector_id: str = Field(
-        max_length=36,
+    connector_id: Id36 = Field(
         description='''
         Connector.id of the Connector of this Location where the charging
         session is/was happening. Allowed to be set to: `#NA` when this
@@ -106,8 +162,8 @@ class OcpiSession(BaseModel):
         ''',
     )
     meter_id: Annotated[str | None, Field(max_length=255, description='Optional identification of the kWh meter.')] = None
-    currency: str = Field(max_length=3, description='ISO 4217 code of the currency used for this session.')
-    charging_periods: Annotated[list[OcpiChargingPeriod], Field(description='An optional list of Charging Periods that can be used to calculate and verify the total cost.')] = []
+    currency: Currency = Field(description='ISO 4217 code of the currency used for this session.')
+    charging_periods: Annotated[list[OcpiChargingPeriod], Field(default_factory=list, description='An optional list of Charging Periods that can be used to calculate and verify the total cost.')]
     total_cost: Annotated[OcpiPrice | None, Field(
         description='''
         The total cost of the session in the specified currency. This is the
@@ -120,78 +176,54 @@ class OcpiSession(BaseModel):
     status: OcpiSessionStatusEnum = Field(description='The status of the session.')
     last_updated: AwareDatetime = Field(description='Timestamp when this Session was last updated (or created).')
 
-    _examples: ClassVar[list[dict]] = [
-        { # Simple Session example of just starting a session
-            "country_code": "NL",
-            "party_id": "STK",
-            "id": "101",
-            "start_date_time": "2020-03-09T10:17:09Z",
-            "kwh": 0.0,
-            "cdr_token": {"uid": "123abc", "type": "RFID", "contract_id": "NL-TST-C12345678-S"},
-            "auth_method": "WHITELIST",
-            "location_id": "LOC1",
-            "evse_uid": "3256",
-            "connector_id": "1",
-            "currency": "EUR",
-            "total_cost": {"excl_vat": 2.5},
-            "status": "PENDING",
-            "last_updated": "2020-03-09T10:17:09Z"
-        },
-        { # Simple Session example of a short finished session
-            "country_code": "BE",
-            "party_id": "BEC",
-            "id": "101",
-            "start_date_time": "2015-06-29T22:39:09Z",
-            "end_date_time": "2015-06-29T23:50:16Z",
-            "kwh": 41.00,
-            "cdr_token": {"uid": "123abc", "type": "RFID", "contract_id": "NL-TST-C12345678-S"},
-            "auth_method": "WHITELIST",
-            "location_id": "LOC1",
-            "evse_uid": "3256",
-            "connector_id": "1",
-            "currency": "EUR",
-            "charging_periods": [
-                {
-                    "start_date_time": "2015-06-29T22:39:09Z",
-                    "dimensions": [{"type": "ENERGY", "volume": 120}, {"type": "MAX_CURRENT", "volume": 30}]
-                },
-                {
-                    "start_date_time": "2015-06-29T22:40:54Z",
-                    "dimensions": [{"type": "ENERGY", "volume": 41000}, {"type": "MIN_CURRENT", "volume": 34}]
-                },
-                {
-                    "start_date_time": "2015-06-29T23:07:09Z",
-                    "dimensions": [{"type": "PARKING_TIME", "volume": 0.718}],
-                    "tariff_id": "12"
-                }
-            ],
-            "total_cost": {"excl_vat": 8.50, "incl_vat": 9.35},
-            "status": "COMPLETED",
-            "last_updated": "2015-06-29T23:50:17Z"
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'OcpiSession':
+        '''
+        Build a Session, including its `cdr_token`, `charging_periods` and `total_cost`, without validation, see `construct_trusted`.
+        Only for data that came out of our own storage; to change an already validated Session use `model_copy(update=...)`.
+        '''
+        return construct_trusted(cls, data)
 
+    @classmethod
+    def from_json_bytes(cls, raw: bytes | str) -> 'OcpiSession':
+        '''
+        Validate a Session straight from raw JSON with `OcpiSessionAdapter`, without an intermediate `json.loads` dict.
+        '''
+        return OcpiSessionAdapter.validate_json(raw)
+
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_SESSION_EXAMPLES))
+
+
+
+# For bulk ingest of raw JSON use `OcpiSession.from_json_bytes(raw)` / `OcpiSessionListAdapter.validate_json(raw)`: one pass in
+# pydantic-core, no intermediate `json.loads` dicts.
+OcpiSessionAdapter = TypeAdapter(OcpiSession)
+OcpiSessionListAdapter = TypeAdapter(list[OcpiSession])
 
 
 
 class OcpiSessionListResponse(OcpiBaseResponse):
     data: list[OcpiSession] = []
 
-    _examples: ClassVar[dict] = [{
-        'data': [OcpiSession._examples[0]], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    @classmethod
+    def parse_data_json(
+        cls, raw: bytes | str, status_code: OcpiStatusCodeEnum = OcpiStatusCodeEnum.SUCCESS, status_message: str | None = None,
+    ) -> 'OcpiSessionListResponse':
+        '''
+        Build a response around a bare JSON array of Sessions, e.g. one page already taken out of its envelope.
+
+        Only the array is validated, in one pass by `OcpiSessionListAdapter`; the envelope is assembled with `model_construct`.
+        '''
+        return cls.model_construct(data=OcpiSessionListAdapter.validate_json(raw), status_code=status_code, status_message=status_message)
+
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_SESSION_LIST_RESPONSE_EXAMPLES))
 
 
 
 class OcpiSessionResponse(OcpiBaseResponse):
     data: OcpiSession = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiSession._examples[0], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_SESSION_RESPONSE_EXAMPLES))
 
 
 
@@ -229,7 +261,4 @@ class OcpiChargingPreferences(BaseModel):
 class OcpiChargingPreferencesResponse(OcpiBaseResponse):
     data: OcpiChargingPreferencesResponseEnum = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiSession._examples[0], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_SESSION_RESPONSE_EXAMPLES))
@@ -1,12 +1,69 @@
-from typing import Annotated, ClassVar
+from typing import Annotated
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiDisplayText
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiDisplayText, schema_examples
 from ocpi_pydantic.v221.enum import OcpiAllowedTypeEnum, OcpiProfileTypeEnum, OcpiTokenTypeEnum, OcpiWhitelistTypeEnum
 
 
 
+_TOKEN_EXAMPLES = [
+    { # A new Token
+        "country_code": "NL",
+        "party_id": "TNM",
+        "uid": "012345678",
+        "type": "RFID",
+        "contract_id": "NL8ACC12E46L89",
+        "visual_number": "DF000-2001-8999-1",
+        "issuer": "TheNewMotion",
+        "group_id": "DF000-2001-8999",
+        "valid": True,
+        "whitelist": "ALWAYS",
+        "last_updated": "2015-06-29T22:39:09Z"
+    },
+    { # Simple APP_USER example
+        "country_code": "DE",
+        "party_id": "TNM",
+        "uid": "bdf21bce-fc97-11e8-8eb2-f2801f1b9fd1",
+        "type": "APP_USER",
+        "contract_id": "DE8ACC12E46L89",
+        "issuer": "TheNewMotion",
+        "valid": True,
+        "whitelist": "ALLOWED",
+        "last_updated": "2018-12-10T17:16:15Z"
+    },
+    { # Full RFID example
+        "country_code": "DE",
+        "party_id": "TNM",
+        "uid": "12345678905880",
+        "type": "RFID",
+        "contract_id": "DE8ACC12E46L89",
+        "visual_number": "DF000-2001-8999-1",
+        "issuer": "TheNewMotion",
+        "group_id": "DF000-2001-8999",
+        "valid": True,
+        "whitelist": "ALLOWED",
+        "language": "it",
+        "default_profile_type": "GREEN",
+        "energy_contract": {"supplier_name": "Greenpeace Energy eG", "contract_id": "0123456789"},
+        "last_updated": "2018-12-10T17:25:10Z"
+    },
+]
+_TOKEN_RESPONSE_EXAMPLES = [{'data': _TOKEN_EXAMPLES[0], **ENVELOPE_EXAMPLE}]
+_TOKEN_LIST_RESPONSE_EXAMPLES = [{'data': [_TOKEN_EXAMPLES[0]], **ENVELOPE_EXAMPLE}]
+_AUTHORIZATION_INFO_EXAMPLES = [{
+    'allowed': OcpiAllowedTypeEnum.ALLOWED,
+    'token': _TOKEN_EXAMPLES[0],
+    'location': None,
+    'authorization_reference': None,
+    'info': None,
+}]
+_AUTHORIZATION_INFO_RESPONSE_EXAMPLES = [{
+    'data': _AUTHORIZATION_INFO_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+
+
+
 class OcpiEnergyContract(BaseModel):
     '''
     OCPI 12.4.2. EnergyContract class
@@ -82,65 +139,21 @@ class OcpiToken(BaseModel):
     energy_contract: Annotated[OcpiEnergyContract | None, Field(description='When the Charge Point supports using your own energy supplier/contract at a Charge Point, information about the energy supplier/contract is needed so the CPO knows which energy supplier to use.')] = None
     last_updated: AwareDatetime = Field(description='Timestamp when this Token was last updated (or created).')
 
-    _examples: ClassVar[list[dict]] = [
-        { # A new Token
-            "country_code": "NL",
-            "party_id": "TNM",
-            "uid": "012345678",
-            "type": "RFID",
-            "contract_id": "NL8ACC12E46L89",
-            "visual_number": "DF000-2001-8999-1",
-            "issuer": "TheNewMotion",
-            "group_id": "DF000-2001-8999",
-            "valid": True,
-            "whitelist": "ALWAYS",
-            "last_updated": "2015-06-29T22:39:09Z"
-        },
-        { # Simple APP_USER example
-            "country_code": "DE",
-            "party_id": "TNM",
-            "uid": "bdf21bce-fc97-11e8-8eb2-f2801f1b9fd1",
-            "type": "APP_USER",
-            "contract_id": "DE8ACC12E46L89",
-            "issuer": "TheNewMotion",
-            "valid": True,
-            "whitelist": "ALLOWED",
-            "last_updated": "2018-12-10T17:16:15Z"
-        },
-        { # Full RFID example
-            "country_code": "DE",
-            "party_id": "TNM",
-            "uid": "12345678905880",
-            "type": "RFID",
-            "contract_id": "DE8ACC12E46L89",
-            "visual_number": "DF000-2001-8999-1",
-            "issuer": "TheNewMotion",
-            "group_id": "DF000-2001-8999",
-            "valid": True,
-            "whitelist": "ALLOWED",
-            "language": "it",
-            "default_profile_type": "GREEN",
-            "energy_contract": {"supplier_name": "Greenpeace Energy eG", "contract_id": "0123456789"},
-            "last_updated": "2018-12-10T17:25:10Z"
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_TOKEN_EXAMPLES))
 
 
 
 class OcpiTokenResponse(OcpiBaseResponse):
     data: OcpiToken = ...
 
-    _examples: ClassVar[dict] = [{'data': OcpiToken._examples[0], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z'}]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_TOKEN_RESPONSE_EXAMPLES))
 
 
 
 class OcpiTokenListResponse(OcpiBaseResponse):
     data: list[OcpiToken] = ...
 
-    _examples: ClassVar[dict] = [{'data': [OcpiToken._examples[0]], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z'}]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_TOKEN_LIST_RESPONSE_EXAMPLES))
 
 
 
@@ -175,21 +188,11 @@ class OcpiAuthorizationInfo(BaseModel):
     authorization_reference: Annotated[str | None, Field(description='Reference to the authorization given by the eMSP')] = None
     info: Annotated[OcpiDisplayText | None, Field(description='')] = None
 
-    _example: ClassVar[dict] = {
-        'allowed': OcpiAllowedTypeEnum.ALLOWED,
-        'token': OcpiToken._examples[0],
-        'location': None,
-        'authorization_reference': None,
-        'info': None,
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_AUTHORIZATION_INFO_EXAMPLES))
 
 
 
 class OcpiAuthorizationInfoResponse(OcpiBaseResponse):
     data: OcpiAuthorizationInfo = ...
 
-    _examples: ClassVar[dict] = [{
-        'data': OcpiAuthorizationInfo._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_AUTHORIZATION_INFO_RESPONSE_EXAMPLES))
\ No newline at end of file
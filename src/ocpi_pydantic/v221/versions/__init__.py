@@ -1,12 +1,55 @@
-from typing import ClassVar
+from functools import cache
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter
 
-from ocpi_pydantic.v221.base import OcpiBaseResponse
+from ocpi_pydantic.v221.base import ENVELOPE_EXAMPLE, OcpiBaseResponse, OcpiUrl, schema_examples
 from ocpi_pydantic.v221.enum import OcpiInterfaceRoleEnum, OcpiModuleIdEnum, OcpiVersionNumberEnum
 
 
 
+_ENDPOINT_EXAMPLES = [
+    {
+        'identifier': OcpiModuleIdEnum.credentials,
+        'role': OcpiInterfaceRoleEnum.RECEIVER,
+        'url': 'https://example.com/ocpi/cpo/2.2/credentials',
+    },
+    {
+        'identifier': OcpiModuleIdEnum.locations,
+        'role': OcpiInterfaceRoleEnum.SENDER,
+        'url': 'https://example.com/ocpi/cpo/2.2/locations',
+    },
+    {
+        'identifier': OcpiModuleIdEnum.tokens,
+        'role': OcpiInterfaceRoleEnum.RECEIVER,
+        'url': 'https://example.com/ocpi/cpo/2.2/tokens',
+    },
+    {
+        'identifier': OcpiModuleIdEnum.locations,
+        'role': OcpiInterfaceRoleEnum.RECEIVER,
+        'url': 'https://example.com/ocpi/emsp/2.2/locations',
+    },
+    {
+        'identifier': OcpiModuleIdEnum.tokens,
+        'role': OcpiInterfaceRoleEnum.SENDER,
+        'url': 'https://example.com/ocpi/emsp/2.2/tokens',
+    },
+]
+_VERSION_EXAMPLES = [{
+    'version': OcpiVersionNumberEnum.v221, 'url': 'https://example.com/ocpi/cpo/2.2/',
+}]
+_VERSION_DETAIL_EXAMPLES = [{
+    'version': OcpiVersionNumberEnum.v221,
+    'endpoints': _ENDPOINT_EXAMPLES,
+}]
+_VERSIONS_RESPONSE_EXAMPLES = [{ # Version information response (list of objects)
+    'data': _VERSION_EXAMPLES, **ENVELOPE_EXAMPLE,
+}]
+_VERSION_DETAILS_RESPONSE_EXAMPLES = [{ # Version details response (one object)
+    'data': _VERSION_DETAIL_EXAMPLES[0], **ENVELOPE_EXAMPLE,
+}]
+
+
+
 class OcpiEndpoint(BaseModel):
     '''
     OCPI 6.2.2. Endpoint class
@@ -17,45 +60,30 @@ class OcpiEndpoint(BaseModel):
     role: OcpiInterfaceRoleEnum = Field(description='Interface role this endpoint implements.')
     url: HttpUrl = Field(description='URL to the endpoint.')
 
-    _examples: ClassVar[list[dict]] = [
-        {
-            'identifier': OcpiModuleIdEnum.credentials,
-            'role': OcpiInterfaceRoleEnum.RECEIVER,
-            'url': 'https://example.com/ocpi/cpo/2.2/credentials',
-        },
-        {
-            'identifier': OcpiModuleIdEnum.locations,
-            'role': OcpiInterfaceRoleEnum.SENDER,
-            'url': 'https://example.com/ocpi/cpo/2.2/locations',
-        },
-        {
-            'identifier': OcpiModuleIdEnum.tokens,
-            'role': OcpiInterfaceRoleEnum.RECEIVER,
-            'url': 'https://example.com/ocpi/cpo/2.2/tokens',
-        },
-        {
-            'identifier': OcpiModuleIdEnum.locations,
-            'role': OcpiInterfaceRoleEnum.RECEIVER,
-            'url': 'https://example.com/ocpi/emsp/2.2/locations',
-        },
-        {
-            'identifier': OcpiModuleIdEnum.tokens,
-            'role': OcpiInterfaceRoleEnum.SENDER,
-            'url': 'https://example.com/ocpi/emsp/2.2/tokens',
-        },
-    ]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_ENDPOINT_EXAMPLES))
+
+
+
+@cache
+def _http_url_adapter() -> TypeAdapter[HttpUrl]:
+    return TypeAdapter(HttpUrl)
 
 
 
 class OcpiVersion(BaseModel):
+    '''
+    OCPI 6.1.2. Version class
+    '''
     version: OcpiVersionNumberEnum
-    url: HttpUrl
+    url: OcpiUrl # Only checked to look like an http(s) URL and kept as `str`; `validated_url()` parses it fully.
+
+    def validated_url(self) -> HttpUrl:
+        '''
+        `url` parsed as a `HttpUrl`, raising `ValidationError` if it is not a valid URL.
+        '''
+        return _http_url_adapter().validate_python(self.url)
 
-    _example: ClassVar[dict] = {
-        'version': OcpiVersionNumberEnum.v221, 'url': 'https://example.com/ocpi/cpo/2.2/',
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_VERSION_EXAMPLES))
 
 
 
@@ -63,28 +91,18 @@ class OcpiVersionDetail(BaseModel):
     version: OcpiVersionNumberEnum = Field(description='The version number.')
     endpoints: list[OcpiEndpoint] = Field(description='A list of supported endpoints for this version.')
 
-    _example: ClassVar[dict] = {
-        'version': OcpiVersionNumberEnum.v221,
-        'endpoints': OcpiEndpoint._examples,
-    }
-    model_config = ConfigDict(json_schema_extra={'examples': [_example]})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_VERSION_DETAIL_EXAMPLES))
 
 
 
 class OcpiVersionsResponse(OcpiBaseResponse):
     data: list[OcpiVersion] = []
 
-    _examples: ClassVar[dict] = [{ # Version information response (list of objects)
-        'data': [OcpiVersion._example], 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_VERSIONS_RESPONSE_EXAMPLES))
 
 
 
 class OcpiVersionDetailsResponse(OcpiBaseResponse):
     data: OcpiVersionDetail = ...
 
-    _examples: ClassVar[dict] = [{ # Version details response (one object)
-        'data': OcpiVersionDetail._example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z',
-    }]
-    model_config = ConfigDict(json_schema_extra={'examples': _examples})
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra=schema_examples(*_VERSION_DETAILS_RESPONSE_EXAMPLES))
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from pytest import raises
+
+from ocpi_pydantic.v221.base import OcpiBaseResponse, OcpiDisplayText, cached_now, encode_error_response, encode_response
+from ocpi_pydantic.v221.enum import OcpiStatusCodeEnum
+from ocpi_pydantic.v221.locations.evse import OcpiEvse, OcpiEvseResponse
+from ocpi_pydantic.v221.locations.location import OcpiLocation, OcpiLocationResponse
+from ocpi_pydantic.v221.sessions import OcpiSession, OcpiSessionListResponse
+from ocpi_pydantic.v221.versions import OcpiVersionDetail, OcpiVersionDetailsResponse
+
+
+
+class TestBase:
+    def test_encode_response_matches_model_dump_json(self):
+        data = [OcpiDisplayText(language='en', text='Standard Tariff')]
+        encoded = encode_response(data, OcpiStatusCodeEnum.SUCCESS)
+        response = OcpiBaseResponse.model_validate_json(encoded)
+        assert response.timestamp.tzinfo == timezone.utc
+        assert encoded == response.model_dump_json().encode()
+
+
+    def test_cached_now_is_truncated_utc(self):
+        now = cached_now()
+        assert now.tzinfo == timezone.utc
+        assert now.microsecond == 0
+        assert abs((datetime.now(timezone.utc) - now).total_seconds()) < 2
+        assert OcpiBaseResponse(status_code=OcpiStatusCodeEnum.SUCCESS).timestamp.microsecond == 0
+
+        with patch('ocpi_pydantic.v221.base.time', return_value=1435701599.5):
+            assert OcpiBaseResponse(status_code=OcpiStatusCodeEnum.SUCCESS).timestamp == datetime(2015, 6, 30, 21, 59, 59, tzinfo=timezone.utc)
+
+
+    def test_nested_json_schema_keeps_leaf_examples(self):
+        schema = OcpiLocation.model_json_schema()
+        assert schema['$defs']['OcpiDisplayText']['examples'] == [{'language': 'en', 'text': 'Standard Tariff'}]
+        assert schema['$defs']['OcpiGeoLocation']['examples'] == [{'latitude': '51.047599', 'longitude': '3.729944'}]
+        assert schema['$defs']['OcpiImage']['examples'][0]['category'] == 'OPERATOR'
+
+
+    def test_encode_error_response(self):
+        response = OcpiBaseResponse.model_validate_json(encode_error_response(OcpiStatusCodeEnum.INVALID_OR_MISSING_PARAMETERS))
+        assert response.data is None
+        assert response.status_code == OcpiStatusCodeEnum.INVALID_OR_MISSING_PARAMETERS
+        assert response.status_message == 'Invalid or missing parameters'
+        assert response.timestamp.tzinfo == timezone.utc
+
+        response = OcpiBaseResponse.model_validate_json(encode_error_response(OcpiStatusCodeEnum.CLIENT_ERROR, 'Missing required field: type'))
+        assert response.status_message == 'Missing required field: type'
+
+        response = OcpiBaseResponse.model_validate_json(encode_error_response(OcpiStatusCodeEnum.UNABLE_TO_USE_THE_CLIENTS_API))
+        assert response.status_message == 'Unable to use the client’s API'
+        with raises(ValueError): encode_error_response(OcpiStatusCodeEnum.SUCCESS)
+
+
+    def test_to_json_bytes_matches_model_dump_json(self):
+        response = OcpiLocationResponse.model_validate(OcpiLocationResponse.model_json_schema()['examples'][0])
+        assert response.to_json_bytes() == response.model_dump_json().encode()
+
+
+    def test_response_json_schema_examples_wrap_data_examples(self):
+        for model, example in (
+            (OcpiEvseResponse, {'data': OcpiEvse.model_json_schema()['examples'][0]}),
+            (OcpiSessionListResponse, {'data': [OcpiSession.model_json_schema()['examples'][0]]}),
+            (OcpiVersionDetailsResponse, {'data': OcpiVersionDetail.model_json_schema()['examples'][0]}),
+        ):
+            assert model.model_json_schema()['examples'] == [{**example, 'status_code': 1000, 'timestamp': '2015-06-30T21:59:59Z'}]
@@ -1,9 +1,24 @@
 from datetime import datetime, timezone
 
+from pydantic import ValidationError
+from pytest import importorskip, raises
+
+from ocpi_pydantic.v221.base import OcpiDisplayText
+from ocpi_pydantic.v221.enum import OcpiCapabilityEnum, OcpiConnectorFormatEnum, OcpiConnectorTypeEnum, OcpiImageCategoryEnum, OcpiPowerTypeEnum, OcpiStatusEnum
+from ocpi_pydantic.v221.locations import OcpiGeoLocation, OcpiImage
+from ocpi_pydantic.v221.locations.connector import OcpiConnector
+from ocpi_pydantic.v221.locations.evse import OcpiEvse, OcpiStatusSchedule
 from ocpi_pydantic.v221.locations.location import OcpiExceptionalPeriod
 
 
 class TestLocations:
+    last_updated = datetime(2019, 6, 24, 12, 39, 9, tzinfo=timezone.utc)
+    connector = {
+        'id': '1', 'standard': 'IEC_62196_T2', 'format': 'SOCKET', 'power_type': 'AC_3_PHASE',
+        'max_voltage': 220, 'max_amperage': 16, 'last_updated': last_updated,
+    }
+
+
     def test_exceptional_period_model_with_datetime_string(self):
         p = OcpiExceptionalPeriod.model_validate({
             'period_begin': '2018-12-25T03:00:00Z', 'period_end': '2018-12-25T05:00:00Z',
@@ -21,4 +36,99 @@ class TestLocations:
         p_tz = OcpiExceptionalPeriod.model_validate({
             'period_begin': datetime(2018, 12, 25, 3, 0, 0, 0, timezone.utc),
             'period_end': datetime(2018, 12,25, 5, 0, 0, 0, timezone.utc),
-        })
\ No newline at end of file
+        })
+
+
+    def test_evse_from_trusted_builds_nested_models(self):
+        last_updated = TestLocations.last_updated
+        evse = OcpiEvse.from_trusted({
+            'uid': '3256',
+            'status': OcpiStatusEnum.AVAILABLE,
+            'connectors': [{
+                'id': '1',
+                'standard': OcpiConnectorTypeEnum.IEC_62196_T2,
+                'format': OcpiConnectorFormatEnum.SOCKET,
+                'power_type': OcpiPowerTypeEnum.AC_3_PHASE,
+                'max_voltage': 220,
+                'max_amperage': 16,
+                'last_updated': last_updated,
+            }],
+            'status_schedule': [{'period_begin': last_updated, 'status': OcpiStatusEnum.BLOCKED}],
+            'directions': [{'language': 'en', 'text': 'Go left'}],
+            'last_updated': last_updated,
+        })
+        assert isinstance(evse.connectors[0], OcpiConnector)
+        assert isinstance(evse.status_schedule[0], OcpiStatusSchedule)
+        assert isinstance(evse.directions[0], OcpiDisplayText)
+        assert evse.images == []
+        assert evse == OcpiEvse.model_validate(evse.model_dump())
+
+
+    def test_image_url_is_kept_as_string(self):
+        image = OcpiImage(url='https://example.com/logo.png', category=OcpiImageCategoryEnum.OPERATOR, type='png')
+        assert image.url == 'https://example.com/logo.png'
+        assert OcpiImage.model_json_schema()['properties']['url']['format'] == 'uri'
+
+        with raises(ValidationError):
+            OcpiImage(url='ftp://example.com/logo.png', category=OcpiImageCategoryEnum.OPERATOR, type='png')
+
+
+    def test_geo_location_keeps_ocpi_strings(self):
+        coordinates = OcpiGeoLocation(latitude='51.0475995', longitude='3.72994')
+        assert coordinates.model_dump() == {'latitude': '51.0475995', 'longitude': '3.72994'}
+        assert (coordinates.latitude_float, coordinates.longitude_float) == (51.0475995, 3.72994)
+        assert OcpiGeoLocation.model_json_schema()['properties']['latitude']['type'] == 'string'
+
+
+    def test_evse_batch_filters(self):
+        importorskip('numpy')
+        from ocpi_pydantic.v221.locations.batch import OcpiEvseBatch
+
+        gent, brussels, nowhere = [OcpiEvse.model_validate({
+            'uid': uid, 'status': 'AVAILABLE', 'connectors': [TestLocations.connector], 'coordinates': coordinates, 'last_updated': TestLocations.last_updated,
+        }) for uid, coordinates in (
+            ('gent', {'latitude': '51.047599', 'longitude': '3.729944'}),
+            ('brussels', {'latitude': '50.846557', 'longitude': '4.351697'}),
+            ('nowhere', None),
+        )]
+        batch = OcpiEvseBatch([gent, brussels, nowhere])
+
+        assert batch.within_radius(51.05, 3.73, 5) == [gent]
+        assert batch.within_radius(51.05, 3.73, 100) == [gent, brussels]
+        assert batch.within_bounding_box(50, 4, 51, 5) == [brussels]
+        assert batch.updated_since(TestLocations.last_updated) == [gent, brussels, nowhere]
+        assert batch.updated_since(datetime(2020, 1, 1, tzinfo=timezone.utc)) == []
+
+
+    def test_evse_status_schedule_items_are_models(self):
+        evse = OcpiEvse.model_validate({
+            'uid': '3256',
+            'status': 'AVAILABLE',
+            'status_schedule': [{'period_begin': '2019-06-25T00:00:00Z', 'status': 'BLOCKED'}],
+            'connectors': [TestLocations.connector],
+            'last_updated': TestLocations.last_updated,
+        })
+        assert evse.status_schedule == [OcpiStatusSchedule(period_begin=datetime(2019, 6, 25, tzinfo=timezone.utc), status=OcpiStatusEnum.BLOCKED)]
+        assert evse.status_schedule[0].status == OcpiStatusEnum.BLOCKED
+        assert evse.model_dump(mode='json')['status_schedule'] == [{'period_begin': '2019-06-25T00:00:00Z', 'period_end': None, 'status': 'BLOCKED'}]
+        assert OcpiStatusSchedule.model_json_schema()['required'] == ['period_begin', 'status']
+
+
+    def test_evse_capabilities_are_sets_dumped_in_enum_order(self):
+        evse = OcpiEvse.model_validate({
+            'uid': '3256',
+            'status': 'AVAILABLE',
+            'capabilities': ['RFID_READER', 'RESERVABLE', 'CHARGING_PROFILE_CAPABLE', 'RESERVABLE'],
+            'parking_restrictions': ['PLUGGED', 'EV_ONLY'],
+            'connectors': [TestLocations.connector],
+            'last_updated': TestLocations.last_updated,
+        })
+        assert evse.capabilities == {OcpiCapabilityEnum.CHARGING_PROFILE_CAPABLE, OcpiCapabilityEnum.RESERVABLE, OcpiCapabilityEnum.RFID_READER}
+        dumped = evse.model_dump(mode='json')
+        assert dumped['capabilities'] == ['CHARGING_PROFILE_CAPABLE', 'RESERVABLE', 'RFID_READER']
+        assert dumped['parking_restrictions'] == ['EV_ONLY', 'PLUGGED']
+        assert OcpiEvse.model_validate_json(evse.model_dump_json()) == evse
+        assert OcpiEvse.model_json_schema(mode='serialization')['properties']['capabilities']['items'] == {'$ref': '#/$defs/OcpiCapabilityEnum'}
+        assert OcpiEvse.model_json_schema(mode='serialization')['properties']['parking_restrictions']['anyOf'] == [
+            {'items': {'$ref': '#/$defs/OcpiParkingRestrictionEnum'}, 'type': 'array'}, {'type': 'null'},
+        ]
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import ValidationError
+from pytest import raises
+
+from ocpi_pydantic.v221.base import OcpiPrice
+from ocpi_pydantic.v221.cdrs import OcpiCdrToken
+from ocpi_pydantic.v221.enum import OcpiAuthMethodEnum, OcpiSessionStatusEnum, OcpiStatusCodeEnum, OcpiTokenTypeEnum
+from ocpi_pydantic.v221.sessions import OcpiSession, OcpiSessionListAdapter, OcpiSessionListResponse
+
+
+
+class TestSessions:
+    trusted_session = {
+        'country_code': 'TW',
+        'party_id': 'WNC',
+        'id': 'S1',
+        'start_date_time': datetime(2020, 3, 9, 10, 17, 9, tzinfo=timezone.utc),
+        'kwh': 0.0,
+        'cdr_token': {
+            'country_code': 'TW', 'party_id': 'WNC', 'uid': '123abc', 'type': OcpiTokenTypeEnum.RFID, 'contract_id': 'C1',
+        },
+        'auth_method': OcpiAuthMethodEnum.WHITELIST,
+        'location_id': 'LOC1',
+        'evse_uid': '3256',
+        'connector_id': '1',
+        'currency': 'TWD',
+        'total_cost': {'excl_vat': Decimal('2.5')},
+        'status': OcpiSessionStatusEnum.PENDING,
+        'last_updated': datetime(2020, 3, 9, 10, 17, 9, tzinfo=timezone.utc),
+    }
+
+
+    def test_session_from_trusted_builds_nested_models(self):
+        session = OcpiSession.from_trusted(TestSessions.trusted_session)
+        assert isinstance(session.cdr_token, OcpiCdrToken)
+        assert isinstance(session.total_cost, OcpiPrice)
+        assert session.charging_periods == []
+        assert session == OcpiSession.model_validate(TestSessions.trusted_session)
+
+
+    def test_session_list_response_parse_data_json(self):
+        raw = OcpiSessionListAdapter.dump_json([OcpiSession.model_validate(TestSessions.trusted_session)])
+        response = OcpiSessionListResponse.parse_data_json(raw)
+        assert response.status_code == OcpiStatusCodeEnum.SUCCESS
+        assert response.data == [OcpiSession.model_validate(TestSessions.trusted_session)]
+        assert OcpiSessionListResponse.model_validate_json(response.to_json_bytes()) == response
+
+
+    def test_session_kwh(self):
+        assert OcpiSession.model_validate({**TestSessions.trusted_session, 'kwh': '41.00'}).kwh == 41.0
+        with raises(ValidationError): OcpiSession.model_validate({**TestSessions.trusted_session, 'kwh': -1})
+
+
+    def test_session_from_json_bytes(self):
+        session = OcpiSession.model_validate(TestSessions.trusted_session)
+        assert OcpiSession.from_json_bytes(session.model_dump_json().encode()) == session
@@ -0,0 +1,14 @@
+from pydantic import ValidationError
+from pytest import raises
+
+from ocpi_pydantic.v221.enum import OcpiVersionNumberEnum
+from ocpi_pydantic.v221.versions import OcpiVersion
+
+
+
+class TestVersions:
+    def test_version_url(self):
+        version = OcpiVersion(version=OcpiVersionNumberEnum.v221, url='https://example.com/ocpi/cpo/2.2/')
+        assert version.url == 'https://example.com/ocpi/cpo/2.2/'
+        assert version.validated_url().host == 'example.com'
+        with raises(ValidationError): OcpiVersion(version=OcpiVersionNumberEnum.v221, url='example.com/ocpi/cpo/2.2/')